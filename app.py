@@ -1,10 +1,23 @@
+import hashlib
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")  # headless backend; dashboard figures are rasterized to PNG
+
+import matplotlib.pyplot as plt
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 from src.pdf_to_csv import pdf_to_dataframe
 from src.data_enrichment import enrich
-import tempfile
 from src.charts import (
+    DEFAULT_FIGSIZE,
+    dashboard_aggregates,
     plot_monthly_spending,
     plot_weekly_spending,
     plot_category_spending,
@@ -32,6 +45,103 @@ st.set_page_config(
     layout="wide",
 )
 
+# Worker pool for the PDF parse + enrichment, so the Streamlit script thread
+# (which also serves the websocket) isn't blocked by CPU-bound work.
+ANALYSIS_POOL = ThreadPoolExecutor(max_workers=2)
+
+# On-disk cache of enriched frames, keyed by PDF content hash. Unlike
+# st.cache_data this survives server restarts and is shared across sessions.
+CACHE_DIR = Path(".cache")
+
+
+# --- Cached pipeline ---
+@st.cache_data(show_spinner=False)
+def run_analysis_pipeline(pdf_bytes: bytes) -> pd.DataFrame:
+    """PDF bytes -> enriched DataFrame, memoized on the file content.
+
+    Re-uploading the same PDF (or a Streamlit rerun) skips both PDF parsing
+    and enrichment entirely; a parquet copy on disk covers repeat analyses
+    across sessions and server restarts.
+    """
+    cache_path = CACHE_DIR / f"{hashlib.sha256(pdf_bytes).hexdigest()}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+
+    # pdfplumber reads the upload straight from memory; no tempfile round-trip
+    raw_df = pdf_to_dataframe(io.BytesIO(pdf_bytes))
+    enriched_df = enrich(raw_df)
+
+    cache_path.parent.mkdir(exist_ok=True)
+    enriched_df.to_parquet(cache_path, compression="zstd")
+    return enriched_df
+
+
+@st.cache_data(show_spinner=False)
+def month_insights(df: pd.DataFrame, month: str) -> dict:
+    """All Quick Insights metrics for one month, computed once and cached.
+
+    The full frame is filtered to the month a single time; the seven insight
+    functions then only scan that (much smaller) slice. Re-selecting a month
+    already visited is a pure cache hit.
+    """
+    mdf = df[df["Month"] == month]
+    return {
+        "total_spend": total_spend_in_month(mdf, month),
+        "txn_count": transaction_count_in_month(mdf, month),
+        "avg_txn": average_transaction_in_month(mdf, month),
+        "top_merchant": top_merchant_in_month(mdf, month),
+        "top_category": top_category_in_month(mdf, month),
+        "top_week": highest_spending_week_in_month(mdf, month),
+        "weekend_weekday": weekend_vs_weekday_spend(mdf, month),
+    }
+
+
+# Dashboard charts, keyed by the name used in chart_png()
+DASHBOARD_CHARTS = {
+    "monthly": plot_monthly_spending,
+    "weekly": plot_weekly_spending,
+    "category": plot_category_spending,
+    "merchants": plot_top_merchants,
+    "day_of_week": plot_day_of_week_spending,
+    "spend_bucket": plot_spend_bucket_distribution,
+}
+
+
+@st.cache_data(show_spinner=False)
+def dashboard_series(df: pd.DataFrame) -> dict:
+    """All Dashboard chart aggregations, computed in one pass per key column
+    and shared by the six plots below."""
+    return dashboard_aggregates(df)
+
+
+@st.cache_data(show_spinner=False)
+def chart_png(df: pd.DataFrame, which: str) -> bytes:
+    """Render one dashboard chart to PNG bytes, cached on (frame, chart).
+
+    On a rerun with unchanged data this re-emits the cached bytes without
+    any matplotlib work, and the explicit close keeps Figures from piling
+    up across reruns.
+    """
+    fig = DASHBOARD_CHARTS[which](df, precomputed=dashboard_series(df)[which])
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def csv_download_bytes(df: pd.DataFrame) -> bytes:
+    """CSV bytes for the download button.
+
+    Streamlit evaluates the download payload on every rerun of the page, so
+    the serialization is cached per frame and done by pyarrow's columnar CSV
+    writer instead of pandas' row-at-a-time to_csv.
+    """
+    buf = io.BytesIO()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue()
+
+
 # --- Session state init ---
 if "page" not in st.session_state:
     st.session_state.page = "landing"
@@ -77,22 +187,21 @@ def render_landing_page():
                 st.warning("Please upload a PhonePe transaction PDF to continue.")
                 return
 
-            with st.spinner("Analyzing your transactions..."):
-                # Save uploaded PDF temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-                    tmp_pdf.write(uploaded_file.read())
-                    temp_pdf_path = Path(tmp_pdf.name)
-
-                # PDF → DataFrame
-                raw_df = pdf_to_dataframe(temp_pdf_path)
+            # PDF → enriched DataFrame (cached on file content), computed on a
+            # worker thread so the status indicator keeps animating and other
+            # sessions aren't starved during the parse.
+            future = ANALYSIS_POOL.submit(run_analysis_pipeline, uploaded_file.getvalue())
 
-                # Enrich data
-                enriched_df = enrich(raw_df)
+            with st.status("Analyzing your transactions...") as status:
+                while not future.done():
+                    time.sleep(0.1)
+                enriched_df = future.result()
+                status.update(label="Analysis complete", state="complete")
 
-                # Store in session state
-                st.session_state.df = enriched_df
-                st.session_state.page = "dashboard"
-                st.rerun()
+            # Store in session state
+            st.session_state.df = enriched_df
+            st.session_state.page = "dashboard"
+            st.rerun()
 
     # --------------------
     # RIGHT: What user will see (tabs)
@@ -205,8 +314,7 @@ def render_dashboard_page():
         with col1:
             st.markdown("**Monthly Spending Trend**")
             try:
-                fig = plot_monthly_spending(df)
-                st.pyplot(fig, use_container_width=True)
+                st.image(chart_png(df, "monthly"), use_container_width=True)
             except Exception as e:
                 st.error("Unable to generate monthly spending chart.")
                 st.exception(e)
@@ -214,8 +322,7 @@ def render_dashboard_page():
         with col2:
             st.markdown("**Weekly Spending Trend**")
             try:
-                fig = plot_weekly_spending(df)
-                st.pyplot(fig, use_container_width=True)
+                st.image(chart_png(df, "weekly"), use_container_width=True)
             except Exception as e:
                 st.error("Unable to generate weekly spending chart.")
                 st.exception(e)
@@ -227,8 +334,7 @@ def render_dashboard_page():
         with col3:
             st.markdown("**Category-wise Spending**")
             try:
-                fig = plot_category_spending(df)
-                st.pyplot(fig, use_container_width=True)
+                st.image(chart_png(df, "category"), use_container_width=True)
             except Exception as e:
                 st.error("Unable to generate category spending chart.")
                 st.exception(e)
@@ -236,8 +342,7 @@ def render_dashboard_page():
         with col4:
             st.markdown("**Top Merchants by Spend**")
             try:
-                fig = plot_top_merchants(df)
-                st.pyplot(fig, use_container_width=True)
+                st.image(chart_png(df, "merchants"), use_container_width=True)
             except Exception as e:
                 st.error("Unable to generate top merchants chart.")
                 st.exception(e)
@@ -249,8 +354,7 @@ def render_dashboard_page():
         with col5:
             st.markdown("**Spending by Day of Week**")
             try:
-                fig = plot_day_of_week_spending(df)
-                st.pyplot(fig, use_container_width=True)
+                st.image(chart_png(df, "day_of_week"), use_container_width=True)
             except Exception as e:
                 st.error("Unable to generate day-of-week chart.")
                 st.exception(e)
@@ -258,8 +362,7 @@ def render_dashboard_page():
         with col6:
             st.markdown("**Spend Bucket Distribution**")
             try:
-                fig = plot_spend_bucket_distribution(df)
-                st.pyplot(fig, use_container_width=True)
+                st.image(chart_png(df, "spend_bucket"), use_container_width=True)
             except Exception as e:
                 st.error("Unable to generate spend bucket chart.")
                 st.exception(e)
@@ -305,7 +408,7 @@ def render_dashboard_page():
         # --------------------
         # Time filtering
         # --------------------
-        filtered_df = df.copy()
+        filtered_df = df
 
         if time_mode == "Single Month":
             month = st.selectbox("Select Month", sorted(df["Month"].unique()))
@@ -319,10 +422,11 @@ def render_dashboard_page():
                 st.error("Start date must be before end date.")
                 st.stop()
 
-            filtered_df = df[
-                (df["Date"].dt.date >= start_date) &
-                (df["Date"].dt.date <= end_date)
-            ]
+            # Compare Timestamps directly (one vectorized int64 compare);
+            # .dt.date would materialize N python date objects per rerun.
+            ts_start = pd.Timestamp(start_date)
+            ts_end = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+            filtered_df = df[(df["Date"] >= ts_start) & (df["Date"] < ts_end)]
 
         # --------------------
         # Metric mapping
@@ -344,6 +448,12 @@ def render_dashboard_page():
                 st.warning("No data available for the selected filters.")
                 st.stop()
 
+            # One Figure per session for Explore: each regeneration clears and
+            # redraws the same axes instead of building a new Figure.
+            if "explore_ax" not in st.session_state:
+                _, st.session_state.explore_ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
+            explore_ax = st.session_state.explore_ax
+
             # Line chart validation
             if chart_type == "Line" and group_by not in ["Week_Number", "Day_Of_Week"]:
                 st.warning("Line charts are only supported for time-based groupings.")
@@ -359,7 +469,8 @@ def render_dashboard_page():
                         aggregated,
                         title=f"{metric_label} by {group_by}",
                         ylabel=metric_label,
-                        horizontal=False
+                        horizontal=False,
+                        ax=explore_ax
                     )
 
                 elif chart_type == "Horizontal Bar":
@@ -367,7 +478,8 @@ def render_dashboard_page():
                         aggregated,
                         title=f"{metric_label} by {group_by}",
                         ylabel=metric_label,
-                        horizontal=True
+                        horizontal=True,
+                        ax=explore_ax
                     )
 
                 else:  # Line chart
@@ -376,7 +488,8 @@ def render_dashboard_page():
                         aggregated.values,
                         title=f"{metric_label} by {group_by}",
                         xlabel=group_by,
-                        ylabel=metric_label
+                        ylabel=metric_label,
+                        ax=explore_ax
                     )
 
                 st.pyplot(fig, use_container_width=True)
@@ -397,14 +510,16 @@ def render_dashboard_page():
         selected_month = st.selectbox("Select Month", months)
 
         try:
-            total_spend = total_spend_in_month(df, selected_month)
-            txn_count = transaction_count_in_month(df, selected_month)
-            avg_txn = average_transaction_in_month(df, selected_month)
+            insights = month_insights(df, selected_month)
+
+            total_spend = insights["total_spend"]
+            txn_count = insights["txn_count"]
+            avg_txn = insights["avg_txn"]
 
-            top_merchant = top_merchant_in_month(df, selected_month)
-            top_category = top_category_in_month(df, selected_month)
-            top_week = highest_spending_week_in_month(df, selected_month)
-            weekend_weekday = weekend_vs_weekday_spend(df, selected_month)
+            top_merchant = insights["top_merchant"]
+            top_category = insights["top_category"]
+            top_week = insights["top_week"]
+            weekend_weekday = insights["weekend_weekday"]
 
             col1, col2, col3 = st.columns(3)
 
@@ -447,14 +562,15 @@ def render_dashboard_page():
     elif section == "Data View":
         st.header("Data View")
 
-        display_df = df.copy()
-        display_df["Date"] = display_df["Date"].dt.date
+        # Swap in the precomputed date-only column for display; no per-rerun
+        # conversion and no full-frame copy.
+        display_df = df.assign(Date=df["DateOnly"]).drop(columns=["DateOnly"])
 
         st.dataframe(display_df, use_container_width=True)
 
         st.download_button(
             label="Download Enriched Data (CSV)",
-            data=display_df.to_csv(index=False),
+            data=csv_download_bytes(display_df),
             file_name="phonepe_enriched_data.csv",
             mime="text/csv"
         )
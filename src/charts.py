@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 DEFAULT_FIGSIZE = (10, 6)
@@ -7,16 +8,73 @@ def _validate_df(df):
         raise ValueError("Input DataFrame is empty or None.")
 
 
+def _grouped_amount(df, col, metric="sum", observed=True):
+    """Aggregate Amount by one column in a single fused pass.
+
+    For categorical columns this is one np.bincount over the integer codes
+    (sum and count come out of the same pass) instead of a full pandas
+    groupby pipeline per chart. Non-categorical keys fall back to groupby.
+    """
+    series = df[col]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        valid = codes >= 0
+        codes = codes[valid]
+        n = len(series.cat.categories)
+        amounts = df["Amount"].to_numpy(dtype=np.float64)[valid]
+        sums = np.bincount(codes, weights=amounts, minlength=n)
+        counts = np.bincount(codes, minlength=n)
+        if metric == "sum":
+            values = sums
+        elif metric == "count":
+            values = counts
+        else:  # mean
+            values = np.divide(sums, counts, out=np.full(n, np.nan), where=counts > 0)
+        if observed:
+            seen = counts > 0
+            return pd.Series(values[seen], index=series.cat.categories[seen], name="Amount")
+        return pd.Series(values, index=series.cat.categories, name="Amount")
+
+    # Amount is stored float32; widen before accumulating, matching
+    # insights._group_sum
+    amounts = df["Amount"].astype("float64")
+    grouped = amounts.groupby(df[col], observed=True, sort=False)
+    if metric == "sum":
+        return grouped.sum()
+    if metric == "count":
+        return grouped.size()
+    return grouped.mean()
+
+
 def _validate_date_range(start_date, end_date):
     if start_date > end_date:
         raise ValueError("start_date must be before end_date.")
 
 
-# Monthly spending trend
-def plot_monthly_spending(df: pd.DataFrame):
+# Precomputed Dashboard aggregations. Each chart's series comes from one pass
+# here instead of every plot function re-running its own groupby per render;
+# the plot builders accept the result via their `precomputed` argument.
+def dashboard_aggregates(df: pd.DataFrame) -> dict:
     _validate_df(df)
+    amounts = df["Amount"].astype("float64")
+    return {
+        "monthly": amounts.groupby(df["Date"].dt.to_period("M"), sort=False).sum(),
+        "weekly": amounts.groupby(df["Week_Number"], sort=False).sum(),
+        "category": _grouped_amount(df, "Category").sort_values(ascending=False),
+        "merchants": _grouped_amount(df, "Merchant").nlargest(10),
+        "day_of_week": _grouped_amount(df, "Day_Of_Week", observed=False),
+        "spend_bucket": _grouped_amount(df, "SpendBucket", metric="count"),
+    }
 
-    monthly = df.groupby(df["Date"].dt.to_period("M"))["Amount"].sum()
+
+# Monthly spending trend
+def plot_monthly_spending(df: pd.DataFrame, precomputed: pd.Series = None):
+    if precomputed is None:
+        _validate_df(df)
+        # df is Date-sorted by enrich(), so appearance order is chronological
+        monthly = df["Amount"].astype("float64").groupby(df["Date"].dt.to_period("M"), sort=False).sum()
+    else:
+        monthly = precomputed
     monthly.index = monthly.index.astype(str)
 
     fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
@@ -31,9 +89,12 @@ def plot_monthly_spending(df: pd.DataFrame):
     return fig
 
 #Weekly spending trend
-def plot_weekly_spending(df: pd.DataFrame):
-    _validate_df(df)
-    weekly = df.groupby("Week_Number")["Amount"].sum().sort_index()
+def plot_weekly_spending(df: pd.DataFrame, precomputed: pd.Series = None):
+    if precomputed is None:
+        _validate_df(df)
+        weekly = df["Amount"].astype("float64").groupby(df["Week_Number"], sort=False).sum()
+    else:
+        weekly = precomputed
 
     fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
     ax.plot(weekly.index, weekly.values, marker="o")
@@ -47,9 +108,12 @@ def plot_weekly_spending(df: pd.DataFrame):
 
 
 #Category-wise spending
-def plot_category_spending(df: pd.DataFrame):
-    _validate_df(df)
-    category = df.groupby("Category")["Amount"].sum().sort_values(ascending=False)
+def plot_category_spending(df: pd.DataFrame, precomputed: pd.Series = None):
+    if precomputed is None:
+        _validate_df(df)
+        category = _grouped_amount(df, "Category").sort_values(ascending=False)
+    else:
+        category = precomputed
 
     fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
     category.plot(kind="bar", ax=ax)
@@ -62,14 +126,13 @@ def plot_category_spending(df: pd.DataFrame):
 
 
 #Top Merchants by Spend
-def plot_top_merchants(df: pd.DataFrame, top_n: int = 10):
-    _validate_df(df)
-    merchants = (
-        df.groupby("Merchant")["Amount"]
-          .sum()
-          .sort_values(ascending=False)
-          .head(top_n)
-    )
+def plot_top_merchants(df: pd.DataFrame, top_n: int = 10, precomputed: pd.Series = None):
+    if precomputed is None:
+        _validate_df(df)
+        # Partial heap select: O(M log k) over all merchants vs a full sort
+        merchants = _grouped_amount(df, "Merchant").nlargest(top_n)
+    else:
+        merchants = precomputed
 
     fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
     merchants.plot(kind="barh", ax=ax)
@@ -81,10 +144,14 @@ def plot_top_merchants(df: pd.DataFrame, top_n: int = 10):
     return fig
 
 #Spending by Day of Week
-def plot_day_of_week_spending(df: pd.DataFrame):
-    _validate_df(df)
-    order = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"]
-    dow = df.groupby("Day_Of_Week")["Amount"].sum().reindex(order)
+def plot_day_of_week_spending(df: pd.DataFrame, precomputed: pd.Series = None):
+    if precomputed is None:
+        _validate_df(df)
+        # Day_Of_Week is an ordered Categorical, so groupby already yields
+        # Monday..Sunday (observed=False keeps empty days in the plot).
+        dow = _grouped_amount(df, "Day_Of_Week", observed=False)
+    else:
+        dow = precomputed
 
     fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
     dow.plot(kind="bar", ax=ax)
@@ -96,9 +163,12 @@ def plot_day_of_week_spending(df: pd.DataFrame):
 
 
 #Spend Bucket Distribution
-def plot_spend_bucket_distribution(df: pd.DataFrame):
-    _validate_df(df)
-    bucket = df.groupby("SpendBucket")["Amount"].count()
+def plot_spend_bucket_distribution(df: pd.DataFrame, precomputed: pd.Series = None):
+    if precomputed is None:
+        _validate_df(df)
+        bucket = _grouped_amount(df, "SpendBucket", metric="count")
+    else:
+        bucket = precomputed
 
     fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
     bucket.plot(kind="bar", ax=ax)
@@ -116,7 +186,13 @@ def filter_by_month(df, month_str):
     month_str: '2025-03' or 'Mar-2025'
     """
     _validate_df(df)
-    return df[df["Date"].dt.to_period("M").astype(str) == month_str]
+    try:
+        period = pd.Period(month_str, freq="M")
+    except Exception:
+        # Unparseable label: keep the (slow) string-compare behavior
+        return df[df["Date"].dt.to_period("M").astype(str) == month_str]
+    # Two timestamp compares instead of formatting every row's month label
+    return df[(df["Date"] >= period.start_time) & (df["Date"] < (period + 1).start_time)]
 
 
 def filter_by_date_range(df, start_date, end_date):
@@ -145,22 +221,28 @@ def aggregate_data(df, group_by, metric):
 
 
     if metric == "sum":
-        return df.groupby(group_by)["Amount"].sum()
+        return _grouped_amount(df, group_by, metric="sum")
     elif metric == "count":
-        return df.groupby(group_by).size()
+        return _grouped_amount(df, group_by, metric="count")
     elif metric == "mean":
-        return df.groupby(group_by)["Amount"].mean()
+        return _grouped_amount(df, group_by, metric="mean")
     else:
         raise ValueError("Invalid metric")
 
 
 # Generic bar chart builder
-def plot_bar(series, title, xlabel="", ylabel="", horizontal=False, top_n=None):
+def plot_bar(series, title, xlabel="", ylabel="", horizontal=False, top_n=None, ax=None):
 
     if top_n:
-        series = series.sort_values(ascending=False).head(top_n)
+        series = series.nlargest(top_n)
 
-    fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
+    # Passing ax= reuses an existing Figure (cleared first) instead of paying
+    # Figure + layout-engine construction on every call.
+    if ax is None:
+        fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
+    else:
+        fig = ax.figure
+        ax.cla()
 
     if horizontal:
         series.sort_values().plot(kind="barh", ax=ax)
@@ -176,8 +258,12 @@ def plot_bar(series, title, xlabel="", ylabel="", horizontal=False, top_n=None):
 
 
 #Generic line chart builder
-def plot_line(x, y, title, xlabel="", ylabel=""):
-    fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
+def plot_line(x, y, title, xlabel="", ylabel="", ax=None):
+    if ax is None:
+        fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
+    else:
+        fig = ax.figure
+        ax.cla()
     ax.plot(x, y, marker="o")
     ax.set_title(title)
     ax.set_xlabel(xlabel)
@@ -209,7 +295,7 @@ def plot_date_range_trend(df, start_date, end_date):
     _validate_date_range(start_date, end_date)
 
     filtered = filter_by_date_range(df, start_date, end_date)
-    daily = filtered.groupby("Date")["Amount"].sum()
+    daily = filtered["Amount"].astype("float64").groupby(filtered["Date"]).sum()
 
     return plot_line(
         daily.index,
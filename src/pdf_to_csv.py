@@ -1,46 +1,125 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pdfplumber
 import pandas as pd
 import re
-from pathlib import Path
-import tempfile
-
-def pdf_to_csv(pdf_path: str, csv_path: str):
-    """Extract PhonePe transactions from PDF and save them to CSV."""
-    transactions = []
-
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            for line in page.extract_text().split('\n'):
-                if re.match(r"[A-Za-z]{3,4}\s\d{2}", line) and not line.startswith("Page"):
-                    match = re.match(
-                        r"([A-Za-z]{3,4}\s\d{1,2},\s20\d{2})+\sPaid to (.+?)\s+(DEBIT|CREDIT)\s*₹([\d,]+)",
-                        line
-                    )
-                    if match:
-                        date, merchant, txn_type, amount = match.groups()
-                        transactions.append({
-                            "Date": date,
-                            "Merchant": merchant.strip(),
-                            "Type": txn_type,
-                            "Amount": float(amount.replace(",", ""))
-                        })
-
-    pd.DataFrame(transactions).to_csv(csv_path, index=False)
-
-
-def pdf_to_dataframe(pdf_path):
+
+# Compiled once at import; one finditer pass over each page's full text
+# replaces the old split-per-line + match-per-line loop.
+_TXN_RE = re.compile(
+    r"([A-Za-z]{3,4}\s\d{1,2},\s20\d{2})\s+Paid to (.+?)\s+(DEBIT|CREDIT)\s*₹([\d,]+)"
+)
+
+# Below this page count the process spawn + PDF re-open cost outweighs
+# parallel text extraction.
+_PARALLEL_MIN_PAGES = 8
+
+
+def _parse_page_text(text: str) -> tuple:
+    """Match transactions in one page's extracted text.
+
+    Returns four parallel column lists (dates, merchants, types, amounts)
+    rather than one dict per row: the DataFrame is then built column-wise
+    with no per-row dict allocation or column re-assembly. Date and Amount
+    stay as raw strings here; _transactions_frame converts whole columns
+    at once instead of one float()/strptime per row.
     """
-    Convert PhonePe PDF directly into a DataFrame (Streamlit-friendly).
+    dates, merchants, types, amounts = [], [], [], []
+    # Cheap substring gate: summary/cover pages with no transactions skip
+    # the regex scan entirely (also covers pages that extract to None).
+    if not text or "Paid to" not in text:
+        return dates, merchants, types, amounts
+    for match in _TXN_RE.finditer(text):
+        date, merchant, txn_type, amount = match.groups()
+        dates.append(date)
+        merchants.append(merchant.strip())
+        types.append(txn_type)
+        amounts.append(amount)
+    return dates, merchants, types, amounts
+
+
+def _extend_columns(columns: tuple, page_columns: tuple) -> None:
+    for col, page_col in zip(columns, page_columns):
+        col.extend(page_col)
+
+
+def _parse_pages(pdf_bytes: bytes, page_indices: list) -> tuple:
+    """Worker: open the PDF from bytes and parse a slice of its pages."""
+    columns = ([], [], [], [])
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        for i in page_indices:
+            _extend_columns(columns, _parse_page_text(pdf.pages[i].extract_text()))
+    return columns
+
+
+def _read_pdf_bytes(pdf_source) -> bytes:
+    if hasattr(pdf_source, "read"):
+        return pdf_source.read()
+    with open(pdf_source, "rb") as f:
+        return f.read()
+
+
+def _extract_transactions(pdf_source) -> tuple:
+    """Parse PhonePe transactions from a PDF (path or file-like) into column lists.
+
+    Text extraction dominates parse time, so large statements are split
+    across worker processes (bytes are picklable; each worker re-opens
+    its own pdfplumber handle). Small PDFs stay on the serial path.
     """
-    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
-        temp_csv_path = Path(tmp.name)
+    pdf_bytes = _read_pdf_bytes(pdf_source)
 
-    pdf_to_csv(pdf_path, temp_csv_path)
-    df = pd.read_csv(temp_csv_path)
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        n_pages = len(pdf.pages)
+        if n_pages < _PARALLEL_MIN_PAGES:
+            columns = ([], [], [], [])
+            for page in pdf.pages:
+                _extend_columns(columns, _parse_page_text(page.extract_text()))
+            return columns
 
+    workers = min(os.cpu_count() or 1, n_pages)
+    # Contiguous page blocks keep the output in document order.
+    step = -(-n_pages // workers)
+    chunks = [list(range(lo, min(lo + step, n_pages))) for lo in range(0, n_pages, step)]
+    columns = ([], [], [], [])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for worker_columns in pool.map(_parse_pages, [pdf_bytes] * len(chunks), chunks):
+            _extend_columns(columns, worker_columns)
+    return columns
+
+
+def _transactions_frame(columns: tuple) -> pd.DataFrame:
+    """Build the typed DataFrame: column-wise Amount/Date conversion in one pass each."""
+    dates, merchants, types, amounts = columns
+    df = pd.DataFrame(
+        {"Date": dates, "Merchant": merchants, "Type": types, "Amount": amounts}
+    )
+    if not df.empty:
+        df["Amount"] = pd.to_numeric(df["Amount"].str.replace(",", "", regex=False))
+        # _TXN_RE also matches 4-letter month tokens ("Sept", "June",
+        # "July") that strict '%b' rejects; trimming the token to its
+        # 3-letter abbreviation first keeps the whole column on one
+        # vectorized strict parse.
+        dates = df["Date"].str.replace(r"^([A-Za-z]{3})[A-Za-z]+", r"\1", regex=True)
+        df["Date"] = pd.to_datetime(dates, format="%b %d, %Y", errors="coerce")
     return df
 
 
+def pdf_to_csv(pdf_source, csv_path: str):
+    """Extract PhonePe transactions from a PDF (path or file-like) and save them to CSV."""
+    _transactions_frame(_extract_transactions(pdf_source)).to_csv(csv_path, index=False)
+
+
+def pdf_to_dataframe(pdf_source):
+    """
+    Convert a PhonePe PDF (path or file-like, e.g. io.BytesIO) into a DataFrame
+    (Streamlit-friendly). Built directly from the parsed transactions — no
+    intermediate file on disk.
+    """
+    return _transactions_frame(_extract_transactions(pdf_source))
+
+
 
 
 